@@ -156,6 +156,8 @@ def run_pipeline(document_type: str, assets: list = None, output_base: str = "./
     except Exception as e:
         print(f"\n❌ Pipeline failed: {e}")
         raise
+    finally:
+        team_runner_factory.shutdown()
 
 
 def main():
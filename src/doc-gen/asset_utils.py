@@ -53,6 +53,7 @@ class AssetUtils:
             normalized_team.setdefault('allow_repeated_speaker', workflow_config.get('allow_repeated_speaker'))
             normalized_team.setdefault('max_selector_attempts', workflow_config.get('max_selector_attempts'))
             normalized_team.setdefault('termination_keyword', workflow_config.get('termination_keyword'))
+            normalized_team.setdefault('debug_raw', workflow_config.get('debug_raw', False))
             
             # Set defaults for required fields
             normalized_team.setdefault('labeled_inputs', [])
@@ -79,6 +80,7 @@ class AssetUtils:
                 allow_repeated_speaker=normalized_team.get('allow_repeated_speaker'),
                 max_selector_attempts=normalized_team.get('max_selector_attempts'),
                 termination_keyword=normalized_team.get('termination_keyword'),
+                debug_raw=bool(normalized_team.get('debug_raw')),
                 # Test-specific configuration
                 test_delay_seconds=normalized_team.get('test_delay_seconds'),
                 test_failure_mode=normalized_team.get('test_failure_mode'),
@@ -117,6 +119,7 @@ class AssetUtils:
             normalized_team.setdefault('allow_repeated_speaker', workflow_config.get('allow_repeated_speaker'))
             normalized_team.setdefault('max_selector_attempts', workflow_config.get('max_selector_attempts'))
             normalized_team.setdefault('termination_keyword', workflow_config.get('termination_keyword'))
+            normalized_team.setdefault('debug_raw', workflow_config.get('debug_raw', False))
             
             # Set defaults for required fields
             normalized_team.setdefault('labeled_inputs', [])
@@ -143,6 +146,7 @@ class AssetUtils:
                 allow_repeated_speaker=normalized_team.get('allow_repeated_speaker'),
                 max_selector_attempts=normalized_team.get('max_selector_attempts'),
                 termination_keyword=normalized_team.get('termination_keyword'),
+                debug_raw=bool(normalized_team.get('debug_raw')),
                 # Test-specific configuration
                 test_delay_seconds=normalized_team.get('test_delay_seconds'),
                 test_failure_mode=normalized_team.get('test_failure_mode'),
@@ -33,6 +33,9 @@ class TeamConfig:
     job_folder: Optional[str] = None
     document_type: Optional[str] = None
     
+    # Dump every message to the .raw.md log (off: the raw log only gets its header)
+    debug_raw: bool = False
+    
     # Test-specific configuration (optional, for testing scenarios)
     test_delay_seconds: Optional[float] = None  # How long to wait during run()
     test_failure_mode: Optional[str] = None     # "exception", "timeout", "partial_failure", None
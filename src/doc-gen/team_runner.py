@@ -9,25 +9,251 @@ public symbols: TeamRunner and TeamRunnerFactory.
 """
 
 from __future__ import annotations
-from typing import Optional, Any, Protocol, TYPE_CHECKING, Dict, List
+from typing import Optional, Any, Callable, Protocol, TYPE_CHECKING, Dict, List, Mapping, Sequence
+from types import MappingProxyType
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import contextlib
+import errno
+import fnmatch
+import functools
+import glob
+import json
+import os
+import random
+import re
+import shutil
+import threading
 import yaml
 import asyncio
+import atexit
 
-# AutoGen imports
-from autogen_agentchat.agents import AssistantAgent
-from autogen_ext.models.openai import OpenAIChatCompletionClient
-from autogen_agentchat.teams import SelectorGroupChat
-from autogen_agentchat.conditions import MaxMessageTermination, TextMentionTermination
-from autogen_agentchat.base import OrTerminationCondition
-from autogen_core.tools import FunctionTool
-from autogen_core.tools import StaticWorkbench
+# Optional async file I/O for conversation logs (falls back to worker threads)
+try:
+    import aiofiles
+    HAS_AIOFILES = True
+except ImportError:
+    HAS_AIOFILES = False
 
+# Optional faster event loop for the factory's shared loop
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+# Optional compiled JSON encoder for the .steps.jsonl records
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Development mode: when AutoGen cannot run a conversation, substitute a canned
+# one (team_simulation) instead of failing the team.
+_DEV_MODE = os.getenv("RAQ_DEV") == "1"
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# AutoGen (and the openai SDK it pulls in) takes about a second to import, so
+# it is only imported where a runner actually builds agents.
 if TYPE_CHECKING:
     from team import TeamConfig
+    from autogen_agentchat.agents import AssistantAgent
+    from autogen_agentchat.teams import SelectorGroupChat
+    from autogen_core.tools import FunctionTool
 
 __all__ = ["TeamRunner", "TeamRunnerFactory"]
 
+# Rate-limited conversations are retried (with jittered exponential backoff)
+# only while nothing has been streamed yet, so no message is logged twice.
+_RATE_LIMIT_RETRIES = 3
+
+# Message sources whose content is the team's final output (as are any whose
+# name contains "final")
+_FINAL_SOURCES = frozenset({'markdown_agent'})
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of parsed YAML: mappings become MappingProxyType, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@functools.lru_cache(maxsize=64)
+def _load_template(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """Parse a team template YAML file.
+
+    Cached per (path, mtime_ns, size), like the input content cache, so
+    runners sharing a template parse it once per process, while edits to the
+    file are still picked up. The result is
+    shared between callers, so it is returned deeply read-only.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return _freeze(yaml.load(f, Loader=_YamlLoader))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """Compile a single-component glob pattern, matching names as glob.glob does."""
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
+class _DirListing:
+    """A single scandir snapshot of one folder.
+
+    Shared by everything that resolves inputs in one pass (glob matches,
+    existence checks, mtimes), so the folder is listed once and each file
+    stat'd at most once instead of every lookup hitting the filesystem.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        try:
+            with os.scandir(directory) as entries:
+                self._entries = {entry.name: entry for entry in entries}
+        except OSError:
+            self._entries = {}
+
+    def glob(self, pattern: str) -> List[str]:
+        """Return the paths whose names match a single-component glob ``pattern``.
+
+        Equivalent to ``glob.glob(directory / pattern)``: same order, and
+        hidden names only match dot patterns.
+        """
+        regex = _compile_glob(pattern)
+        include_hidden = pattern.startswith('.')
+        return [entry.path for name, entry in self._entries.items()
+                if (include_hidden or not name.startswith('.')) and regex.match(name)]
+
+    def stat(self, path: Path) -> os.stat_result:
+        """Stat ``path``, from the snapshot when it lives directly in this folder."""
+        if path.parent != self.directory:
+            return path.stat()
+        entry = self._entries.get(path.name)
+        if entry is None:
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), str(path))
+        return entry.stat()
+
+
+def _build_model_client(model: str, temperature: float, http_client: Optional[Any] = None):
+    """Construct an OpenAI chat completion client, optionally on a shared HTTP client."""
+    from autogen_ext.models.openai import OpenAIChatCompletionClient
+    client_kwargs = {}
+    if http_client is not None:
+        client_kwargs['http_client'] = http_client
+    return OpenAIChatCompletionClient(model=model, temperature=temperature, **client_kwargs)
+
+
+_MISSING = object()
+
+# Lines that open / close a markdown code block around the final output
+_FENCE_OPENERS = frozenset({'```markdown', '```'})
+_FENCE_CLOSERS = frozenset({'```', 'TERMINATE'})
+
+# Section markers in a steps log: an end marker (group 1 set) or a section
+# start (group 2 is the section name). Markers only count at the start of a
+# line, which callers check; leaving ``^`` out of the pattern lets the regex
+# engine jump between "<!--- " occurrences instead of trying every position.
+_SECTION_MARKER_RE = re.compile(
+    r'<!--- (?:(END) SECTION:[^\n]*|SECTION:([^\n]*)--->[^\S\n]*$)',
+    re.MULTILINE,
+)
+
+
+def _section_summary(text: str, start: int, end: int, limit: int = 200) -> str:
+    """Join the non-blank, stripped lines of ``text[start:end]`` with spaces,
+    truncated to ``limit`` characters (plus "...").
+
+    Stops reading lines once the summary is known to be truncated, so long
+    sections cost no more than short ones.
+    """
+    lines = []
+    length = -1
+    pos = start
+    while pos < end and length <= limit:
+        line_end = text.find('\n', pos, end)
+        if line_end == -1:
+            line_end = end
+        line = text[pos:line_end].strip()
+        pos = line_end + 1
+        if line:
+            lines.append(line)
+            length += len(line) + 1
+    content = ' '.join(lines)
+    return content[:limit] + "..." if length > limit else content
+
+
+@functools.lru_cache(maxsize=128)
+def _section_tags(source_name: str) -> tuple:
+    """Return (open marker, close marker, is_final_output) for a message source.
+
+    Sources are a handful of agent names per team, so every runner in the
+    process shares one cache.
+    """
+    section_name = source_name.upper().replace('_', ' ')
+    is_final = source_name in _FINAL_SOURCES or 'final' in source_name.lower()
+    return f"<!--- SECTION: {section_name} --->\n", f"\n<!--- END SECTION: {section_name} --->\n\n", is_final
+
+
+def _json_line(record: Dict[str, Any]) -> str:
+    """Encode a record as one compact JSON line (non-ASCII kept as-is)."""
+    if HAS_ORJSON:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE).decode()
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n"
+
+
+def _dump_message(message: Any) -> str:
+    """Serialize a message for the raw debug log.
+
+    AutoGen messages are pydantic models, whose compiled JSON serializer is
+    much faster than str() on the model and produces parseable output.
+    """
+    model_dump_json = getattr(message, 'model_dump_json', None)
+    if model_dump_json is not None:
+        try:
+            return model_dump_json()
+        except Exception:
+            pass
+    return str(message)
+
+
+# Written to a team's output file when its execution fails
+_ERROR_TEMPLATE = """# {team_name} - Execution Error
+
+**Error occurred during team execution**
+
+- **Team ID**: {team_id}
+- **Timestamp**: {timestamp}
+- **Error**: {error_message}
+
+## Error Details
+
+The team execution failed with the above error. Please check the configuration and try again.
+"""
+
+# Message type -> (content attribute, default source), or None for opaque
+# events; see _message_fields
+_MESSAGE_FIELDS: Dict[type, Optional[tuple]] = {}
+
+
+def _message_fields(message: Any) -> Optional[tuple]:
+    """Classify where content and source live on a conversation message."""
+    if getattr(message, 'content', _MISSING) is not _MISSING:
+        return 'content', 'Unknown'
+    if getattr(message, 'text', _MISSING) is not _MISSING:
+        return 'text', 'System'
+    return None
+
 
 class Logger(Protocol):
     """Logger protocol for type hints."""
@@ -35,16 +261,156 @@ class Logger(Protocol):
     def error(self, message: str, component: str = "core") -> None: ...
 
 
+class _ThreadedFile:
+    """Async file wrapper used when aiofiles is not installed: each call runs in a worker thread."""
+
+    def __init__(self, f):
+        self._f = f
+
+    async def write(self, data: str) -> int:
+        return await asyncio.to_thread(self._f.write, data)
+
+    async def flush(self) -> None:
+        await asyncio.to_thread(self._f.flush)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._f.close)
+
+
+async def _open_async(path: Path, mode: str):
+    """Open a text file for awaitable writes (aiofiles, or a thread-backed wrapper)."""
+    if HAS_AIOFILES:
+        return await aiofiles.open(path, mode, encoding='utf-8', buffering=1 << 16)
+    return _ThreadedFile(await asyncio.to_thread(open, path, mode, encoding='utf-8', buffering=1 << 16))
+
+
+class _ConversationLog:
+    """Append-only writer for a team's steps and raw conversation logs.
+
+    Alongside the human-readable steps markdown, each message is recorded as
+    one ``{"source", "content"}`` JSON object per line in a ``.steps.jsonl``
+    sidecar, so tools can read the conversation without parsing markers.
+
+    Producers enqueue entries without touching the disk; a single background
+    task drains the queue in batches and writes them through async file
+    handles (one write per file per batch), so streaming a conversation
+    never blocks the shared event loop on file I/O. Files are flushed only
+    at checkpoints (final output, errors) and on close; in between, the
+    64 KiB buffers coalesce writes. A failed write does not stop the drain;
+    the first failure is re-raised from ``aclose()`` once the files are
+    closed. Create with ``await _ConversationLog.open``.
+    """
+
+    def __init__(self, steps_f, raw_f, records_f, batch_size: int = 32):
+        self._steps_f = steps_f
+        self._raw_f = raw_f
+        self._records_f = records_f
+        self._batch_size = batch_size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._error: Optional[Exception] = None  # first failed write, re-raised by aclose()
+        self._writer_task = asyncio.create_task(self._drain())
+
+    @classmethod
+    async def open(cls, steps_file: Path, raw_file: Path, records_file: Path, batch_size: int = 32) -> _ConversationLog:
+        steps_f = await _open_async(steps_file, 'a')
+        raw_f = await _open_async(raw_file, 'a')
+        records_f = await _open_async(records_file, 'w')
+        return cls(steps_f, raw_f, records_f, batch_size)
+
+    def write_raw(self, *parts: str) -> None:
+        self._queue.put_nowait((self._raw_f, parts))
+
+    def write_steps(self, *parts: str) -> None:
+        self._queue.put_nowait((self._steps_f, parts))
+
+    def write_record(self, source: str, content: str) -> None:
+        self._queue.put_nowait((self._records_f, (_json_line({"source": source, "content": content}),)))
+
+    def flush(self) -> None:
+        """Queue a checkpoint: everything written so far is flushed to disk."""
+        self._queue.put_nowait((None, ()))
+
+    async def _drain(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._write_batch(batch)
+            except Exception as e:
+                # Keep draining so the conversation is not blocked mid-stream
+                if self._error is None:
+                    self._error = e
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write_batch(self, batch: List[tuple]) -> None:
+        pending: Dict[Any, List[str]] = {}
+        for f, parts in batch:
+            if f is None:
+                await self._write_pending(pending)
+                pending = {}
+                for log_f in (self._raw_f, self._steps_f, self._records_f):
+                    await log_f.flush()
+            else:
+                pending.setdefault(f, []).extend(parts)
+        await self._write_pending(pending)
+
+    @staticmethod
+    async def _write_pending(pending: Dict[Any, List[str]]) -> None:
+        for f, chunks in pending.items():
+            await f.write("".join(chunks))
+
+    async def aclose(self) -> None:
+        """Wait for queued entries to be written, then close (and flush) the files.
+
+        Raises the first write error, if any, so a truncated log is not
+        mistaken for a complete one.
+        """
+        try:
+            await self._queue.join()
+        finally:
+            self._writer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer_task
+            for log_f in (self._raw_f, self._steps_f, self._records_f):
+                await log_f.close()
+        if self._error is not None:
+            raise self._error
+
+
 class TeamRunner:
     """Executes a team's logic using AutoGen."""
 
-    def __init__(self, team_config: Optional[TeamConfig] = None, logger: Optional[Logger] = None, vector_memory=None):
+    def __init__(self, team_config: Optional[TeamConfig] = None, logger: Optional[Logger] = None, vector_memory=None,
+                 event_loop: Optional[asyncio.AbstractEventLoop] = None,
+                 llm_semaphore: Optional[asyncio.Semaphore] = None,
+                 http_client: Optional[Any] = None,
+                 content_cache: Optional[Dict[str, tuple]] = None,
+                 client_provider: Optional[Callable[[str, float], Any]] = None):
         self.team_config = team_config  # complete team configuration
+        job_folder = getattr(team_config, 'job_folder', None)
+        self._job_folder: Optional[Path] = Path(job_folder) if job_folder is not None else None  # inputs/outputs live here
+        self._team_name = team_config.id.replace('_', ' ') if team_config else '<unknown>'  # display name for headers
         self.logger = logger
         self.vector_memory = vector_memory  # vector database for retrieval
+        self.event_loop = event_loop  # shared loop owned by TeamRunnerFactory (None = private loop per start)
+        self.llm_semaphore = llm_semaphore  # caps how many teams talk to the model at once
+        self.http_client = http_client  # shared pooled HTTP client for OpenAI (None = SDK default)
+        # Input file path -> (mtime_ns, size, content); shared across runners by the factory
+        self.content_cache = content_cache if content_cache is not None else {}
+        self.client_provider = client_provider  # returns a shared model client for (model, temperature)
+        # Raw message dumps are opt-in; they can be kilobytes per message
+        self.debug_raw = bool(getattr(team_config, 'debug_raw', False))
+        self._job_listing: Optional[_DirListing] = None  # job folder snapshot while inputs are resolved
+        self._message_count = 0  # messages written in the current conversation
+        self._driver = None  # conversation coroutine chosen for _driver_team
+        self._driver_team = None
         self._initialized = False
         self._running = False
-        self.agents = {}
+        self._paths: Dict[str, Path] = {}  # template and output file paths, built in initialize()
+        self.agents: List[AssistantAgent] = []
         self.autogen_team = None
         self.model_client = None
 
@@ -65,16 +431,30 @@ class TeamRunner:
             return
 
         try:
+            job_folder = self._job_folder
+            output_file = self.team_config.output_file
+            self._paths = {
+                'template': job_folder / self.team_config.template,
+                'output': job_folder / f"{output_file}.md",
+                'steps': job_folder / f"{output_file}.steps.md",
+                'raw': job_folder / f"{output_file}.raw.md",
+                'records': job_folder / f"{output_file}.steps.jsonl",
+            }
+
             # Just verify the template exists, but don't load it yet
-            template_path = Path(self.team_config.job_folder) / self.team_config.template
-            if not template_path.exists():
-                raise FileNotFoundError(f"Team template not found: {template_path}")
+            template_path = self._paths['template']
+            try:
+                template_path.stat()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Team template not found: {template_path}") from None
 
-            # Create OpenAI model client
-            self.model_client = OpenAIChatCompletionClient(
-                model=self.team_config.model,
-                temperature=self.team_config.temperature
-            )
+            # Reuse the factory's model client when available, otherwise create one
+            if self.client_provider is not None:
+                self.model_client = self.client_provider(self.team_config.model, self.team_config.temperature)
+            else:
+                self.model_client = _build_model_client(
+                    self.team_config.model, self.team_config.temperature, self.http_client
+                )
 
             if self.logger:
                 self.logger.log(f"Team {self.team_config.id} basic initialization complete", "team_runner")
@@ -87,7 +467,19 @@ class TeamRunner:
         self._initialized = True
 
     def start(self) -> None:
-        """Execute the team's conversation / workflow using AutoGen."""
+        """Execute the team's conversation / workflow using AutoGen.
+
+        Blocking entry point for thread-based callers (the orchestrator). The
+        work runs on the shared event loop when one was injected so all teams
+        share one loop; otherwise it falls back to a private asyncio.run().
+        """
+        if self.event_loop is not None:
+            asyncio.run_coroutine_threadsafe(self.start_async(), self.event_loop).result()
+        else:
+            asyncio.run(self.start_async())
+
+    async def start_async(self) -> None:
+        """Execute the team's conversation as a coroutine on the running loop."""
         if not self._initialized:
             # Lazy initialize if user forgot.
             self.initialize()
@@ -100,33 +492,39 @@ class TeamRunner:
 
         # CRITICAL: Create agents and AutoGen team at execution time when step files are available
         if not self.agents or not self.autogen_team:
-            self._create_team_at_runtime(team_id)
+            await self._create_team_at_runtime(team_id)
 
         if not self.autogen_team:
             if self.logger:
                 self.logger.error(f"Team {team_id} not properly initialized - no AutoGen team available", "team_runner")
             return
 
+        output_file_path = None
         try:
             self._running = True
             
             # Prepare file paths for output
-            output_file_path = Path(self.team_config.job_folder) / f"{self.team_config.output_file}.md"
-            steps_file = Path(self.team_config.job_folder) / f"{self.team_config.output_file}.steps.md"
-            raw_file = Path(self.team_config.job_folder) / f"{self.team_config.output_file}.raw.md"
+            output_file_path = self._paths['output']
+            steps_file = self._paths['steps']
+            raw_file = self._paths['raw']
+            records_file = self._paths['records']
             
             # Initialize output files
             self._initialize_output_files(output_file_path, steps_file, raw_file, team_id)
             
             # Prepare task message AFTER agents are created but BEFORE conversation
-            task_message = self._prepare_task_message()
+            task_message = await asyncio.to_thread(self._prepare_task_message)
             
             # Run the AutoGen team conversation
             if self.logger:
                 self.logger.log(f"Starting AutoGen conversation for team {team_id}", "team_runner")
             
             # Execute team conversation with real file output
-            final_markdown_content = self._execute_conversation(task_message, steps_file, raw_file, team_id)
+            log = await _ConversationLog.open(steps_file, raw_file, records_file)
+            try:
+                final_markdown_content = await self._execute_conversation(task_message, log, team_id)
+            finally:
+                await log.aclose()
             
             # Save final output
             self._save_final_output(output_file_path, steps_file, final_markdown_content, team_id)
@@ -137,225 +535,192 @@ class TeamRunner:
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error running team {team_id}: {e}", "team_runner")
-            # Create error output
-            self._create_error_output(output_file_path, team_id, str(e))
+            # Create error output (unless we failed before the output path was known)
+            if output_file_path is not None:
+                self._create_error_output(output_file_path, team_id, str(e))
             raise
         finally:
             self._running = False
 
     def _initialize_output_files(self, output_file_path: Path, steps_file: Path, raw_file: Path, team_id: str):
         """Initialize output files with headers and configuration."""
-        from datetime import datetime
+        # One timestamp for both files so their headers line up
+        started_at = datetime.now().isoformat()
+        config = self.team_config
+        team_name = self._team_name
+        job_id = getattr(config, 'job_id', 'unknown')
         
-        # Initialize steps file with clean headers
-        with open(steps_file, 'w', encoding='utf-8') as f:
-            f.write(f"# {team_id.replace('_', ' ')} - Conversation Steps\n\n")
-            f.write(f"*Job ID: {getattr(self.team_config, 'job_id', 'unknown')}*\n")
-            f.write(f"*Timestamp: {datetime.now().isoformat()}*\n\n")
-            
-            # Add configuration information
-            f.write("## Team Configuration\n\n")
-            f.write(f"- **Model**: {self.team_config.model}\n")
-            f.write(f"- **Temperature**: {self.team_config.temperature}\n")
-            f.write(f"- **Max Messages**: {self.team_config.max_messages}\n")
-            f.write(f"- **Allow Repeated Speaker**: {self.team_config.allow_repeated_speaker}\n")
-            f.write(f"- **Max Selector Attempts**: {self.team_config.max_selector_attempts}\n")
-            f.write(f"- **Termination Keyword**: {self.team_config.termination_keyword}\n\n")
+        # Initialize steps file with clean headers and configuration, in one write
+        steps_header = "".join([
+            f"# {team_name} - Conversation Steps\n\n",
+            f"*Job ID: {job_id}*\n",
+            f"*Timestamp: {started_at}*\n\n",
+            "## Team Configuration\n\n",
+            f"- **Model**: {config.model}\n",
+            f"- **Temperature**: {config.temperature}\n",
+            f"- **Max Messages**: {config.max_messages}\n",
+            f"- **Allow Repeated Speaker**: {config.allow_repeated_speaker}\n",
+            f"- **Max Selector Attempts**: {config.max_selector_attempts}\n",
+            f"- **Termination Keyword**: {config.termination_keyword}\n\n",
+        ])
+        with open(steps_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.write(steps_header)
         
         # Initialize raw file
-        with open(raw_file, 'w', encoding='utf-8') as f:
-            f.write(f"# {team_id.replace('_', ' ')} - Raw Debug Data\n\n")
-            f.write(f"Job ID: {getattr(self.team_config, 'job_id', 'unknown')}\n")
-            f.write(f"Timestamp: {datetime.now().isoformat()}\n\n")
+        raw_header = "".join([
+            f"# {team_name} - Raw Debug Data\n\n",
+            f"Job ID: {job_id}\n",
+            f"Timestamp: {started_at}\n\n",
+        ])
+        with open(raw_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.write(raw_header)
 
-    def _execute_conversation(self, task_message: str, steps_file: Path, raw_file: Path, team_id: str) -> str:
+    async def _execute_conversation(self, task_message: str, log: _ConversationLog, team_id: str) -> str:
         """Execute the AutoGen conversation and log output with section markers."""
-        final_markdown_content = None
-        
         if self.logger:
             self.logger.log(f"Starting {team_id} execution...", "team_runner")
         
-        try:
-            # Check if we have a valid AutoGen team
-            if self.logger:
-                self.logger.log(f"DEBUG: AutoGen team type: {type(self.autogen_team)}", "team_runner")
-                self.logger.log(f"DEBUG: AutoGen team has run_stream: {hasattr(self.autogen_team, 'run_stream')}", "team_runner")
-                self.logger.log(f"DEBUG: AutoGen team has run: {hasattr(self.autogen_team, 'run')}", "team_runner")
-            
-            if not hasattr(self.autogen_team, 'run_stream') and not hasattr(self.autogen_team, 'run'):
-                if self.logger:
-                    self.logger.log(f"AutoGen team has no run method, using simulation for {team_id}", "team_runner")
-                return self._simulate_conversation(task_message, steps_file, raw_file, team_id)
-            
-            # Try to run the actual AutoGen conversation
-            if hasattr(self.autogen_team, 'run_stream'):
-                # AutoGen SelectorGroupChat uses run_stream which returns async generator
-                try:
-                    import asyncio
-                    # Run the async conversation
-                    final_markdown_content = asyncio.run(self._run_async_conversation(task_message, steps_file, raw_file, team_id))
-                except Exception as e:
-                    if self.logger:
-                        self.logger.error(f"Error in async conversation execution: {e}", "team_runner")
-                    # Fall back to simulation
-                    final_markdown_content = self._simulate_conversation(task_message, steps_file, raw_file, team_id)
-            elif hasattr(self.autogen_team, 'run'):
-                # Try simple run method
-                final_markdown_content = self._run_simple_conversation(task_message, steps_file, raw_file, team_id)
+        return await self._conversation_driver()(task_message, log, team_id)
+
+    def _conversation_driver(self):
+        """Return the coroutine function that runs a conversation for the current team.
+
+        Chosen once per AutoGen team object rather than probed on every run.
+        Outside development mode errors (including a team without
+        ``run_stream``) propagate; with ``RAQ_DEV=1`` they fall back to simulation.
+        """
+        if self._driver_team is not self.autogen_team:
+            if not _DEV_MODE:
+                self._driver = self._run_async_conversation
+            elif hasattr(self.autogen_team, 'run_stream'):
+                self._driver = self._run_conversation_or_simulate
             else:
-                # No suitable run method found
                 if self.logger:
-                    self.logger.log(f"No suitable AutoGen run method found, using simulation for {team_id}", "team_runner")
-                final_markdown_content = self._simulate_conversation(task_message, steps_file, raw_file, team_id)
-                
+                    self.logger.log(f"AutoGen team {type(self.autogen_team).__name__} has no run_stream method, using simulation", "team_runner")
+                self._driver = self._simulate_conversation
+            self._driver_team = self.autogen_team
+        return self._driver
+
+    async def _run_conversation_or_simulate(self, task_message: str, log: _ConversationLog, team_id: str) -> str:
+        """Stream the AutoGen conversation, falling back to simulation if it fails."""
+        try:
+            return await self._run_async_conversation(task_message, log, team_id)
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Error executing conversation for {team_id}: {e}", "team_runner")
-            # Fall back to simulation on error
-            final_markdown_content = self._simulate_conversation(task_message, steps_file, raw_file, team_id)
-        
-        return final_markdown_content
+                self.logger.error(f"Error in async conversation execution: {e}", "team_runner")
+            return await self._simulate_conversation(task_message, log, team_id)
+
+    def _llm_slot(self):
+        """Context manager holding one of the shared model-call slots (if any)."""
+        return self.llm_semaphore if self.llm_semaphore is not None else contextlib.nullcontext()
 
-    async def _run_async_conversation(self, task_message: str, steps_file: Path, raw_file: Path, team_id: str) -> str:
+    async def _run_async_conversation(self, task_message: str, log: _ConversationLog, team_id: str) -> str:
         """Run async AutoGen conversation with real-time logging."""
+        from openai import RateLimitError
+
         final_markdown_content = None
-        message_count = 0
+        self._message_count = 0
         
         try:
             if self.logger:
                 self.logger.log(f"Starting async AutoGen conversation for {team_id}", "team_runner")
             
-            # Run the AutoGen team stream
-            async for message in self.autogen_team.run_stream(task=task_message):
-                message_count += 1
-                
-                # Log raw message
-                raw_content = f"**Raw Message {message_count}**: {str(message)}\n\n"
-                with open(raw_file, 'a', encoding='utf-8') as raw_f:
-                    raw_f.write(raw_content)
-                
-                # Extract clean content and source
-                clean_content, source_name = self._extract_message_content(message)
-                
-                if clean_content:
-                    # Write clean content with section markers
-                    formatted_content = f"<!--- SECTION: {source_name.upper().replace('_', ' ')} --->\n{clean_content}\n<!--- END SECTION: {source_name.upper().replace('_', ' ')} --->\n\n"
-                    with open(steps_file, 'a', encoding='utf-8') as steps_f:
-                        steps_f.write(formatted_content)
-                    
+            # Run the AutoGen team stream while holding a model slot
+            attempt = 0
+            while True:
+                try:
+                    async with self._llm_slot():
+                        final_markdown_content = await self._pump_messages(
+                            self.autogen_team.run_stream(task=task_message), log
+                        )
+                    break
+                except RateLimitError:
+                    if self._message_count or attempt >= _RATE_LIMIT_RETRIES:
+                        raise
+                    delay = random.uniform(0.5, 2.0) * 2 ** attempt
+                    attempt += 1
                     if self.logger:
-                        self.logger.log(f"[{source_name}]: {clean_content[:100]}...", "team_runner")
-                    
-                    # Check if this is the final output
-                    if source_name == 'markdown_agent' or 'final' in source_name.lower():
-                        final_markdown_content = self._process_markdown_output(clean_content)
-            
+                        self.logger.log(f"Rate limited before first message for {team_id}; retry {attempt} in {delay:.1f}s", "team_runner")
+                    if hasattr(self.autogen_team, 'reset'):
+                        await self.autogen_team.reset()
+                    await asyncio.sleep(delay)
+
             if self.logger:
-                self.logger.log(f"AutoGen conversation completed for {team_id} with {message_count} messages", "team_runner")
+                self.logger.log(f"AutoGen conversation completed for {team_id} with {self._message_count} messages", "team_runner")
                 
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error in async conversation for {team_id}: {e}", "team_runner")
-            # If we got some messages before the error, use them
-            if message_count == 0:
-                # No messages received, fall back to simulation
-                return self._simulate_conversation(task_message, steps_file, raw_file, team_id)
+            log.flush()
+            # If we got some messages before the error, use them; otherwise
+            # fail (_run_conversation_or_simulate handles the RAQ_DEV fallback)
+            if self._message_count == 0:
+                raise
         
         return final_markdown_content
 
-    def _run_streaming_conversation(self, task_message: str, steps_file: Path, raw_file: Path, team_id: str) -> str:
-        """Run streaming AutoGen conversation (sync version)."""
+    async def _pump_messages(self, messages, log: _ConversationLog) -> Optional[str]:
+        """Write every message from an async iterator to the logs.
+
+        The single driver for real and simulated conversations. Counts
+        messages in ``self._message_count`` and returns the processed
+        markdown of the last final-output message, if any.
+        """
         final_markdown_content = None
-        
-        try:
-            for message in self.autogen_team.run_stream(task=task_message):
-                # Log raw message
-                raw_content = f"**Raw Message**: {str(message)}\n\n"
-                with open(raw_file, 'a', encoding='utf-8') as raw_f:
-                    raw_f.write(raw_content)
-                
-                # Extract clean content and source
-                clean_content, source_name = self._extract_message_content(message)
-                
-                if clean_content:
-                    # Write clean content with section markers
-                    formatted_content = f"<!--- SECTION: {source_name.upper().replace('_', ' ')} --->\n{clean_content}\n<!--- END SECTION: {source_name.upper().replace('_', ' ')} --->\n\n"
-                    with open(steps_file, 'a', encoding='utf-8') as steps_f:
-                        steps_f.write(formatted_content)
-                    
-                    if self.logger:
-                        self.logger.log(f"[{source_name}]: {clean_content[:100]}...", "team_runner")
-                    
-                    # Check if this is the final output
-                    if source_name == 'markdown_agent' or 'final' in source_name.lower():
-                        final_markdown_content = self._process_markdown_output(clean_content)
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error in streaming conversation: {e}", "team_runner")
-        
+        write_message = self._write_message
+        async for message in messages:
+            self._message_count += 1
+            final_output = write_message(message, log, self._message_count)
+            if final_output is not None:
+                final_markdown_content = final_output
         return final_markdown_content
 
-    def _run_simple_conversation(self, task_message: str, steps_file: Path, raw_file: Path, team_id: str) -> str:
-        """Run simple AutoGen conversation."""
-        try:
-            result = self.autogen_team.run(task=task_message)
-            
-            # Log the result
-            raw_content = f"**Conversation Result**: {str(result)}\n\n"
-            with open(raw_file, 'a', encoding='utf-8') as raw_f:
-                raw_f.write(raw_content)
-            
-            # Process the result
-            if hasattr(result, 'messages') and result.messages:
-                final_markdown_content = None
-                for message in result.messages:
-                    clean_content, source_name = self._extract_message_content(message)
-                    
-                    if clean_content:
-                        formatted_content = f"<!--- SECTION: {source_name.upper().replace('_', ' ')} --->\n{clean_content}\n<!--- END SECTION: {source_name.upper().replace('_', ' ')} --->\n\n"
-                        with open(steps_file, 'a', encoding='utf-8') as steps_f:
-                            steps_f.write(formatted_content)
-                        
-                        if self.logger:
-                            self.logger.log(f"[{source_name}]: {clean_content[:100]}...", "team_runner")
-                        
-                        if source_name == 'markdown_agent' or 'final' in source_name.lower():
-                            final_markdown_content = self._process_markdown_output(clean_content)
-                
-                return final_markdown_content
-            else:
-                # Single result
-                formatted_content = f"<!--- SECTION: TEAM RESULT --->\n{str(result)}\n<!--- END SECTION: TEAM RESULT --->\n\n"
-                with open(steps_file, 'a', encoding='utf-8') as steps_f:
-                    steps_f.write(formatted_content)
-                
-                return self._process_markdown_output(str(result))
-                
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error in simple conversation: {e}", "team_runner")
+    def _write_message(self, message, log: _ConversationLog, raw_index: Optional[int] = None) -> Optional[str]:
+        """Write one conversation message to the steps log.
+
+        With ``debug_raw`` enabled and a ``raw_index`` given, the full
+        message is also dumped to the raw log. Returns the processed markdown
+        when the message is the team's final output, otherwise None.
+        """
+        # Extract clean content and source
+        clean_content, source_name = self._extract_message_content(message)
+
+        # Log raw message
+        if self.debug_raw and raw_index is not None:
+            log.write_raw(f"**Raw Message {raw_index}**: ", _dump_message(message), "\n\n")
+
+        if not clean_content:
             return None
 
+        # Write clean content with section markers
+        open_tag, close_tag, is_final = _section_tags(source_name)
+        log.write_steps(open_tag, clean_content, close_tag)
+        log.write_record(source_name, clean_content)
+
+        if self.logger:
+            self.logger.log(f"[{source_name}]: {clean_content[:100]}...", "team_runner")
+
+        # Check if this is the final output
+        if is_final:
+            log.flush()
+            return self._process_markdown_output(clean_content)
+        return None
+
     def _extract_message_content(self, message):
         """Extract clean content and source name from AutoGen message."""
         try:
-            clean_content = None
-            source_name = "System"
-            
-            if hasattr(message, 'source') and hasattr(message, 'content'):
-                clean_content = message.content
-                source_name = message.source
-            elif hasattr(message, 'content'):
-                clean_content = message.content
-                source_name = getattr(message, 'source', 'Unknown')
-            elif hasattr(message, 'text'):
-                clean_content = message.text
-                source_name = getattr(message, 'source', 'System')
-            else:
+            # Message shapes are fixed per AutoGen type, so probe each type once
+            message_type = type(message)
+            fields = _MESSAGE_FIELDS.get(message_type, _MISSING)
+            if fields is _MISSING:
+                fields = _MESSAGE_FIELDS[message_type] = _message_fields(message)
+            if fields is None:
                 # For unknown message types, create a placeholder instead of dumping raw data
-                message_type = type(message).__name__
-                clean_content = f"[{message_type} event]"
-                source_name = "System"
+                return f"[{message_type.__name__} event]", "System"
+            
+            content_attr, default_source = fields
+            clean_content = getattr(message, content_attr, None)
+            source_name = getattr(message, 'source', default_source)
             
             # Handle case where clean_content might be a list
             if isinstance(clean_content, list):
@@ -366,7 +731,7 @@ class TeamRunner:
             
             # Ensure we return a string
             if clean_content is None:
-                clean_content = f"[{type(message).__name__} message]"
+                clean_content = f"[{message_type.__name__} message]"
             
             return str(clean_content).strip(), source_name
             
@@ -375,41 +740,10 @@ class TeamRunner:
                 self.logger.error(f"Error extracting message content: {e}", "team_runner")
             return f"[Message extraction error: {e}]", 'System'
 
-    def _simulate_conversation(self, task_message: str, steps_file: Path, raw_file: Path, team_id: str) -> str:
-        """Simulate conversation as fallback (original implementation)."""
-        final_markdown_content = None
-        
-        # Simulate conversation messages
-        simulated_messages = [
-            ("selector", "Starting conversation with initial agent selection."),
-            ("agent_1", "Beginning analysis of the provided assets and requirements."),
-            ("agent_2", "Reviewing the initial analysis and providing feedback."),
-            ("markdown_agent", f"# {team_id.replace('_', ' ').title()} Output\n\nThis is the formatted final output from the {team_id} team conversation.\n\n## Summary\n\nThe team has successfully completed the workflow.")
-        ]
-        
-        for agent_name, content in simulated_messages:
-            # Log raw message
-            raw_content = f"**Raw Message from {agent_name}**: {content}\n\n"
-            with open(raw_file, 'a', encoding='utf-8') as raw_f:
-                raw_f.write(raw_content)
-            
-            # Extract and format clean content with section markers
-            clean_content = content.strip()
-            section_name = agent_name.upper().replace('_', ' ')
-            
-            # Write clean content with section markers
-            formatted_content = f"<!--- SECTION: {section_name} --->\n{clean_content}\n<!--- END SECTION: {section_name} --->\n\n"
-            with open(steps_file, 'a', encoding='utf-8') as steps_f:
-                steps_f.write(formatted_content)
-            
-            if self.logger:
-                self.logger.log(f"[{agent_name}]: {clean_content[:100]}...", "team_runner")
-            
-            # Check if this is the final output (e.g., from markdown_agent)
-            if agent_name == 'markdown_agent':
-                final_markdown_content = self._process_markdown_output(clean_content)
-        
-        return final_markdown_content
+    async def _simulate_conversation(self, task_message: str, log: _ConversationLog, team_id: str) -> str:
+        """Simulate conversation as fallback (development mode only)."""
+        from team_simulation import simulated_messages
+        return await self._pump_messages(simulated_messages(team_id), log)
 
     def _process_markdown_output(self, content: str) -> str:
         """Process markdown agent output to extract clean content."""
@@ -422,10 +756,11 @@ class TeamRunner:
             in_content = False
             
             for line in lines:
-                if line.strip() in ['```markdown', '```'] and not in_content:
+                stripped = line.strip()
+                if stripped in _FENCE_OPENERS and not in_content:
                     in_content = True
                     continue
-                elif line.strip() in ['```', 'TERMINATE']:
+                elif stripped in _FENCE_CLOSERS:
                     break
                 elif in_content:
                     content_lines.append(line)
@@ -435,11 +770,13 @@ class TeamRunner:
             # Remove any trailing TERMINATE and workflow completion messages
             final_content = content.replace('TERMINATE', '').strip()
             
-            # Remove workflow completion messages
-            lines = final_content.split('\n')
+            # Remove workflow completion messages (usually there are none)
+            lowered = final_content.lower()
+            if 'workflow complete' not in lowered and 'ready for' not in lowered:
+                return final_content
             cleaned_lines = []
-            for line in lines:
-                if 'workflow complete' not in line.lower() and 'ready for' not in line.lower():
+            for line, line_lower in zip(final_content.split('\n'), lowered.split('\n')):
+                if 'workflow complete' not in line_lower and 'ready for' not in line_lower:
                     cleaned_lines.append(line)
             return '\n'.join(cleaned_lines).strip()
 
@@ -453,31 +790,20 @@ class TeamRunner:
             if self.logger:
                 self.logger.log(f"Final output saved to: {output_file_path}", "team_runner")
         else:
-            # Fallback: use the steps file content
-            with open(steps_file, 'r', encoding='utf-8') as steps_f:
-                clean_output = steps_f.read()
-            with open(output_file_path, 'w', encoding='utf-8') as f:
-                f.write(clean_output)
+            # Fallback: use the steps file content (copied in-kernel where supported)
+            shutil.copyfile(steps_file, output_file_path)
             
             if self.logger:
                 self.logger.log(f"Fallback output saved to: {output_file_path}", "team_runner")
 
     def _create_error_output(self, output_file_path: Path, team_id: str, error_message: str):
         """Create error output file when team execution fails."""
-        from datetime import datetime
-        
-        error_content = f"""# {team_id.replace('_', ' ')} - Execution Error
-
-**Error occurred during team execution**
-
-- **Team ID**: {team_id}
-- **Timestamp**: {datetime.now().isoformat()}
-- **Error**: {error_message}
-
-## Error Details
-
-The team execution failed with the above error. Please check the configuration and try again.
-"""
+        error_content = _ERROR_TEMPLATE.format(
+            team_name=self._team_name,
+            team_id=team_id,
+            timestamp=datetime.now().isoformat(),
+            error_message=error_message,
+        )
         
         with open(output_file_path, 'w', encoding='utf-8') as f:
             f.write(error_content)
@@ -485,9 +811,12 @@ The team execution failed with the above error. Please check the configuration a
         if self.logger:
             self.logger.error(f"Error output saved to: {output_file_path}", "team_runner")
 
-    def _create_agents(self, team_template: Dict[str, Any], model_client) -> Dict[str, AssistantAgent]:
+    def _create_agents(self, team_template: Mapping[str, Any], model_client) -> List[AssistantAgent]:
         """Create agents from team template configuration."""
-        agents = {}
+        from autogen_agentchat.agents import AssistantAgent
+        from autogen_core.tools import StaticWorkbench
+
+        agents = []
         
         agents_config = team_template.get('agents', [])
         for agent_config in agents_config:
@@ -518,21 +847,22 @@ The team execution failed with the above error. Please check the configuration a
                     self.logger.log(f"Agent {agent_name}: Vector memory requested but not available", "team_runner")
             
             # Create the agent
-            agent = AssistantAgent(name=agent_name, **agent_setup)
-            agents[agent_name] = agent
+            agents.append(AssistantAgent(name=agent_name, **agent_setup))
         
         return agents
 
-    def _create_autogen_team(self, team_template: Dict[str, Any], model_client, agents: Dict[str, AssistantAgent]) -> SelectorGroupChat:
+    def _create_autogen_team(self, team_template: Mapping[str, Any], model_client, agents: List[AssistantAgent]) -> SelectorGroupChat:
         """Create AutoGen SelectorGroupChat team from template."""
+        from autogen_agentchat.teams import SelectorGroupChat
+        from autogen_agentchat.conditions import MaxMessageTermination, TextMentionTermination
+        from autogen_agentchat.base import OrTerminationCondition
+
         selector_config = team_template.get('selector', {})
-        selector_prompt = selector_config.get('system_message', '')
-        
         # Use selector prompt as-is - no template variable injection needed
         selector_prompt = selector_config.get('system_message', '')
         
         return SelectorGroupChat(
-            participants=list(agents.values()),
+            participants=agents,
             termination_condition=OrTerminationCondition(
                 MaxMessageTermination(self.team_config.max_messages),
                 TextMentionTermination(self.team_config.termination_keyword)
@@ -543,19 +873,14 @@ The team execution failed with the above error. Please check the configuration a
             max_selector_attempts=self.team_config.max_selector_attempts
         )
 
-    def _create_team_at_runtime(self, team_id: str) -> None:
+    async def _create_team_at_runtime(self, team_id: str) -> None:
         """Create agents and AutoGen team at runtime when step files are available."""
         if self.logger:
             self.logger.log(f"Creating agents and AutoGen team at runtime for {team_id}", "team_runner")
         
         try:
-            # Load the team template YAML file now
-            template_path = Path(self.team_config.job_folder) / self.team_config.template
-            if not template_path.exists():
-                raise FileNotFoundError(f"Team template not found: {template_path}")
-
-            with open(template_path, 'r', encoding='utf-8') as f:
-                team_template = yaml.safe_load(f)
+            # Load the team template YAML file now, off the shared event loop
+            team_template = await asyncio.to_thread(self._read_team_template)
 
             # Create agents from template with step files now available
             self.agents = self._create_agents(team_template, self.model_client)
@@ -571,7 +896,16 @@ The team execution failed with the above error. Please check the configuration a
                 self.logger.error(f"Failed to create team at runtime for {team_id}: {e}", "team_runner")
             raise
 
-    def _create_agent_tools(self, tool_configs: List) -> List[FunctionTool]:
+    def _read_team_template(self) -> Mapping[str, Any]:
+        """Stat and parse (or fetch from cache) the team template. Blocking."""
+        template_path = self._paths['template']
+        try:
+            stat = template_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Team template not found: {template_path}") from None
+        return _load_template(str(template_path), stat.st_mtime_ns, stat.st_size)
+
+    def _create_agent_tools(self, tool_configs: Sequence) -> List[FunctionTool]:
         """Create function tools from tool configurations."""
         # TODO: Implement tool creation logic similar to old team executor
         # For now, return empty list
@@ -581,7 +915,16 @@ The team execution failed with the above error. Please check the configuration a
         """Prepare the task message for the team with all labeled inputs included."""
         if not self.team_config:
             return "Please begin the workflow."
-        
+
+        # List the job folder once for every input lookup in this pass
+        self._job_listing = _DirListing(self._job_folder) if self._job_folder is not None else None
+        try:
+            return self._build_task_message()
+        finally:
+            self._job_listing = None
+
+    def _build_task_message(self) -> str:
+        """Build the task message for the team with all labeled inputs included."""
         task_parts = [
             f"Document Type: {self.team_config.document_type}",
             f"Team: {self.team_config.id}"
@@ -606,31 +949,37 @@ The team execution failed with the above error. Please check the configuration a
                     processed_labels.add(normalized)
         
         # Generic workflow start message
-        task_parts.append(f"\nPlease begin the {self.team_config.id.replace('_', ' ')} workflow.")
+        task_parts.append(f"\nPlease begin the {self._team_name} workflow.")
         
         return "\n\n".join(task_parts)
 
-    def _update_agent_system_messages_with_step_summaries(self):
-        """Legacy method - no longer used since template variables are injected at runtime."""
-        # This method is now obsolete as template variables are injected 
-        # during agent creation via _inject_template_variables()
-        pass
+    def _route_input(self, filename: str) -> tuple:
+        """Return (resolver, paths) for a labeled input file or pattern.
+
+        ``resolver(filename, paths)`` formats the input; ``paths`` are the
+        files it reads, in order. This is the only place input names are
+        mapped to files.
+        """
+        if filename.endswith("_artifacts"):
+            # {teamname}_artifacts is the team's output, e.g. "epic_discovery" -> "epic_discovery.md"
+            expected_file = f"{filename.replace('_artifacts', '')}.md"
+            paths = [self._job_folder / expected_file] if self._job_folder is not None else []
+            return self._resolve_artifacts_pattern, paths
+        if "*" in filename or "?" in filename:
+            if self._job_folder is None:
+                return self._resolve_glob_pattern, []
+            return self._resolve_glob_pattern, [Path(match) for match in self._match_glob(self._job_folder / filename)]
+        file_path = self._job_folder / filename if self._job_folder is not None else Path(filename)
+        return self._load_literal_file, [file_path]
 
-    def _resolve_artifacts_pattern(self, input_file: str) -> str:
+    def _resolve_artifacts_pattern(self, input_file: str, paths: List[Path]) -> str:
         """Resolve {teamname}_artifacts pattern to actual team output."""
-        # Extract team name from pattern
-        team_prefix = input_file.replace("_artifacts", "")
-        
-        # Convert snake_case to expected output file name
-        # e.g., "epic_discovery" -> "epic_discovery.md"
-        expected_file = f"{team_prefix}.md"
-        
-        if hasattr(self.team_config, 'job_folder'):
-            file_path = Path(self.team_config.job_folder) / expected_file
-            if file_path.exists():
-                content = self._load_file_content(file_path, expected_file)
+        if paths:
+            file_path = paths[0]
+            content = self._load_file_content(file_path, file_path.name)
+            if content is not None:
                 if self.logger:
-                    self.logger.log(f"Resolved {input_file} -> {expected_file}", "team_runner")
+                    self.logger.log(f"Resolved {input_file} -> {file_path.name}", "team_runner")
                 return content
             else:
                 if self.logger:
@@ -638,39 +987,43 @@ The team execution failed with the above error. Please check the configuration a
         
         return f"=== {input_file} ===\nERROR: Could not resolve artifacts pattern\n"
 
-    def _resolve_glob_pattern(self, input_file: str) -> str:
+    def _resolve_glob_pattern(self, input_file: str, paths: List[Path]) -> str:
         """Resolve glob pattern to matching files."""
-        import glob
-        
-        if hasattr(self.team_config, 'job_folder'):
-            pattern_path = Path(self.team_config.job_folder) / input_file
-            matching_files = glob.glob(str(pattern_path))
+        if paths:
+            # Skip files removed since the glob ran
+            content_parts = [content for content in (self._load_file_content(path, path.name) for path in paths)
+                             if content is not None]
             
-            if matching_files:
-                content_parts = []
-                for file_path in matching_files:
-                    file_name = Path(file_path).name
-                    content = self._load_file_content(Path(file_path), file_name)
-                    content_parts.append(content)
-                
-                if self.logger:
-                    self.logger.log(f"Glob {input_file} matched {len(matching_files)} files", "team_runner")
-                return "\n".join(content_parts)
-            else:
-                if self.logger:
-                    self.logger.error(f"Glob pattern {input_file} found no matches", "team_runner")
+            if self.logger:
+                self.logger.log(f"Glob {input_file} matched {len(paths)} files", "team_runner")
+            return "\n".join(content_parts)
+        elif self._job_folder is not None:
+            if self.logger:
+                self.logger.error(f"Glob pattern {input_file} found no matches", "team_runner")
         
         return f"=== {input_file} ===\nERROR: No files matched glob pattern\n"
 
-    def _load_literal_file(self, input_file: str) -> str:
+    def _match_glob(self, pattern_path: Path) -> List[str]:
+        """Return the files matching a glob, as glob.glob would list them."""
+        parent = pattern_path.parent
+        if any(magic in str(parent) for magic in '*?[') or pattern_path.name == '**':
+            return glob.glob(str(pattern_path))
+        listing = self._job_listing
+        if listing is None or listing.directory != parent:
+            listing = _DirListing(parent)
+        return listing.glob(pattern_path.name)
+
+    def _stat(self, path: Path) -> os.stat_result:
+        """Stat an input file, using the job folder snapshot when one is active."""
+        listing = self._job_listing
+        return listing.stat(path) if listing is not None else path.stat()
+
+    def _load_literal_file(self, input_file: str, paths: List[Path]) -> str:
         """Load a literal file path."""
-        if hasattr(self.team_config, 'job_folder'):
-            file_path = Path(self.team_config.job_folder) / input_file
-        else:
-            file_path = Path(input_file)
+        file_path = paths[0]
         
-        if file_path.exists():
-            content = self._load_file_content(file_path, input_file)
+        content = self._load_file_content(file_path, input_file)
+        if content is not None:
             if self.logger:
                 self.logger.log(f"Loaded input file: {input_file}", "team_runner")
             return content
@@ -679,17 +1032,31 @@ The team execution failed with the above error. Please check the configuration a
                 self.logger.error(f"Input file not found: {file_path}", "team_runner")
             return f"=== {input_file} ===\nERROR: File not found at {file_path}\n"
 
-    def _load_file_content(self, file_path: Path, display_name: str) -> str:
-        """Load file content with header formatting."""
+    def _load_file_content(self, file_path: Path, display_name: str) -> Optional[str]:
+        """Load file content with header formatting, or None if the file does not exist."""
         try:
-            # Always include full content regardless of size
-            with open(file_path, 'r', encoding='utf-8') as f:
-                file_content = f.read()
+            # Inputs such as the content brief are shared by every team in a
+            # job, so read each version of a file once per factory. Keying on
+            # the path keeps only the latest version; the size catches rewrites
+            # that land within one mtime tick.
+            st = self._stat(file_path)
+            version = (st.st_mtime_ns, st.st_size)
+            cached = self.content_cache.get(str(file_path))
+            if cached is not None and cached[:2] == version:
+                file_content = cached[2]
+            else:
+                # Always include full content regardless of size
+                file_content = file_path.read_text(encoding='utf-8')
                 # Remove TERMINATE to prevent premature termination
-                file_content = file_content.replace('TERMINATE', '').strip()
+                if 'TERMINATE' in file_content:
+                    file_content = file_content.replace('TERMINATE', '')
+                file_content = file_content.strip()
+                self.content_cache[str(file_path)] = version + (file_content,)
             
             return f"=== {display_name} ===\n{file_content}\n"
                 
+        except FileNotFoundError:
+            return None
         except Exception as e:
             return f"=== {display_name} ===\nERROR: Could not load file - {e}\n"
 
@@ -704,73 +1071,58 @@ The team execution failed with the above error. Please check the configuration a
             return labeled_inputs
             
         # Check for new labeled_inputs format
-        if hasattr(self.team_config, 'labeled_inputs'):
-            labeled_file_list = getattr(self.team_config, 'labeled_inputs', [])
-                
-            for item in labeled_file_list:
-                if isinstance(item, list) and len(item) == 2:
-                    label, filename = item
-                    content = self._load_labeled_file(filename, label)
-                    # Create both the labeled key and a normalized key
-                    labeled_inputs[label] = content
-                    normalized_key = label.lower().replace(' ', '_')
-                    labeled_inputs[normalized_key] = content
-                    
-                    if self.logger:
-                        self.logger.log(f"Loaded labeled input '{label}': {filename} ({len(content)} chars)", "team_runner")
+        labeled_file_list = [item for item in getattr(self.team_config, 'labeled_inputs', None) or []
+                             if isinstance(item, list) and len(item) == 2]
+        # Several labels may point at the same file or pattern; resolve each once
+        routes = {}
+        for label, filename in labeled_file_list:
+            if filename and filename not in routes:
+                routes[filename] = self._route_input(filename)
+        # Read every distinct file on one pool to warm the content cache; the
+        # resolvers then format them in order on this thread
+        paths = list(dict.fromkeys(path for _, route_paths in routes.values() for path in route_paths))
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+                list(executor.map(self._load_file_content, paths, [path.name for path in paths]))
+        resolved = {filename: resolve(filename, route_paths) for filename, (resolve, route_paths) in routes.items()}
+            
+        for label, filename in labeled_file_list:
+            content = resolved[filename] if filename else ""
+            # Create both the labeled key and a normalized key
+            labeled_inputs[label] = content
+            normalized_key = label.lower().replace(' ', '_')
+            labeled_inputs[normalized_key] = content
+            
+            if self.logger:
+                self.logger.log(f"Loaded labeled input '{label}': {filename} ({len(content)} chars)", "team_runner")
 
         return labeled_inputs
 
-    def _load_labeled_file(self, filename: str, label: str) -> str:
-        """Load content for a labeled file input."""
-        if not filename:
-            return ""
-        
-        # Handle different file patterns
-        if filename.endswith("_artifacts"):
-            return self._resolve_artifacts_pattern(filename)
-        elif "*" in filename or "?" in filename:
-            return self._resolve_glob_pattern(filename)
-        else:
-            return self._load_literal_file(filename)
-
     def _extract_agent_flow(self, steps_content: str) -> str:
         """Extract agent interaction flow from conversation steps."""
         if not steps_content:
             return "No conversation steps found"
         
-        lines = steps_content.split('\n')
+        # A section runs from its marker line to the next section or end marker
         agent_interactions = []
         current_section = None
-        current_content = []
-        
-        # Look for section markers and agent interactions
-        for line in lines:
-            # Check for section markers
-            if line.strip().startswith('<!--- SECTION:') and line.strip().endswith('--->'): 
-                if current_section and current_content:
-                    # Save previous section
-                    content_summary = ' '.join(current_content)[:200] + "..." if len(' '.join(current_content)) > 200 else ' '.join(current_content)
+        content_start = 0
+        for marker in _SECTION_MARKER_RE.finditer(steps_content):
+            line_start = steps_content.rfind('\n', 0, marker.start()) + 1
+            if steps_content[line_start:marker.start()].strip():
+                continue
+            if current_section:
+                content_summary = _section_summary(steps_content, content_start, marker.start())
+                if content_summary:
                     agent_interactions.append(f"{current_section}: {content_summary}")
-                
-                # Start new section
-                current_section = line.strip()[14:-4].strip()  # Remove <!--- SECTION: and --->
-                current_content = []
-            elif line.strip().startswith('<!--- END SECTION:'):
-                # End current section
-                if current_section and current_content:
-                    content_summary = ' '.join(current_content)[:200] + "..." if len(' '.join(current_content)) > 200 else ' '.join(current_content)
-                    agent_interactions.append(f"{current_section}: {content_summary}")
-                current_section = None
-                current_content = []
-            elif current_section and line.strip():
-                # Add content to current section
-                current_content.append(line.strip())
+            current_section = None if marker.group(1) else marker.group(2).strip()
+            content_start = marker.end() + 1
         
         # Handle any remaining section
-        if current_section and current_content:
-            content_summary = ' '.join(current_content)[:200] + "..." if len(' '.join(current_content)) > 200 else ' '.join(current_content)
-            agent_interactions.append(f"{current_section}: {content_summary}")
+        if current_section:
+            content_summary = _section_summary(steps_content, content_start, len(steps_content))
+            if content_summary:
+                agent_interactions.append(f"{current_section}: {content_summary}")
         
         if agent_interactions:
             return '\n'.join(agent_interactions)
@@ -795,10 +1147,110 @@ class TeamRunnerFactory:
 
     Kept as a class (instead of a bare function) so that future dependency
     injection (e.g. passing shared model clients, caches) is straightforward.
+
+    The factory owns one event loop, run on a background thread, that every
+    runner it creates executes on. Teams started from orchestrator threads
+    therefore share a single loop instead of building one per asyncio.run().
     """
 
-    def __init__(self, logger_factory: Optional[Any] = None):
+    def __init__(self, logger_factory: Optional[Any] = None, max_concurrent_teams: int = 4):
         self.logger_factory = logger_factory
+        # Bounds how many teams stream from the model concurrently (rate limits)
+        self._llm_semaphore = asyncio.Semaphore(max_concurrent_teams)
+        self._http_client: Optional[Any] = None
+        self._http_client_checked = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        # Cleaned input file contents by path, with their (mtime_ns, size), shared by all runners
+        self._content_cache: Dict[str, tuple] = {}
+        # One model client (and connection pool) per (model, temperature)
+        self._clients: Dict[tuple, Any] = {}
+
+    def get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the shared event loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = uvloop.new_event_loop() if HAS_UVLOOP else asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="team-runner-loop", daemon=True)
+                thread.start()
+                self._loop = loop
+                self._loop_thread = thread
+                # Close pooled connections even if the caller never shuts down
+                atexit.register(self.shutdown)
+            return self._loop
+
+    def get_http_client(self) -> Optional[Any]:
+        """Return the shared aiohttp-backed HTTP client used for OpenAI calls.
+
+        httpx's own async transport degrades under concurrency, so model
+        clients share one aiohttp transport. Returns None (SDK default) when
+        the openai ``aiohttp`` extra isn't installed.
+        """
+        with self._loop_lock:
+            if not self._http_client_checked:
+                self._http_client_checked = True
+                try:
+                    from openai import DefaultAioHttpClient
+                    self._http_client = DefaultAioHttpClient()
+                except (ImportError, RuntimeError):
+                    self._http_client = None
+            return self._http_client
+
+    def get_client(self, model: str, temperature: float):
+        """Return the shared model client for (model, temperature), creating it on first use."""
+        key = (model, temperature)
+        with self._loop_lock:
+            client = self._clients.get(key)
+        if client is None:
+            http_client = self.get_http_client()
+            with self._loop_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = _build_model_client(model, temperature, http_client)
+                    self._clients[key] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the shared model clients, HTTP client and connection pool."""
+        with self._loop_lock:
+            model_clients = list(self._clients.values())
+            self._clients.clear()
+            client = self._http_client
+            self._http_client = None
+            self._http_client_checked = False
+        for model_client in model_clients:
+            await model_client.close()
+        if client is not None:
+            await client.aclose()
+
+    @staticmethod
+    async def _cancel_pending_runs() -> None:
+        """Cancel every other task on the shared loop and wait for them to unwind."""
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def shutdown(self) -> None:
+        """Cancel pending runs and close shared clients, then stop the shared event loop and its thread."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+        if loop is None:
+            return
+        atexit.unregister(self.shutdown)
+        try:
+            # Runs still in flight (e.g. after a failed workflow) would leave their callers blocked forever
+            asyncio.run_coroutine_threadsafe(self._cancel_pending_runs(), loop).result()
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+        finally:
+            # Stop the loop even if a client failed to close
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
 
     def create(self, team: Any) -> TeamRunner:
         logger = None
@@ -808,4 +1260,7 @@ class TeamRunnerFactory:
         # Extract team config and vector memory from the team object
         team_config = getattr(team, 'config', None)
         vector_memory = getattr(team, 'vector_memory', None)
-        return TeamRunner(team_config, logger, vector_memory)
\ No newline at end of file
+        return TeamRunner(team_config, logger, vector_memory,
+                          event_loop=self.get_event_loop(), llm_semaphore=self._llm_semaphore,
+                          http_client=self.get_http_client(), content_cache=self._content_cache,
+                          client_provider=self.get_client)
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""Canned team conversation for development runs.
+
+Only imported by team_runner when ``RAQ_DEV=1``: production runs surface
+AutoGen failures as errors instead of writing simulated output.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SimulatedMessage:
+    """Stand-in conversation message used when AutoGen cannot run."""
+    source: str
+    content: str
+
+
+async def simulated_messages(team_id: str):
+    """Yield a canned conversation ending with a markdown_agent result."""
+    yield SimulatedMessage("selector", "Starting conversation with initial agent selection.")
+    yield SimulatedMessage("agent_1", "Beginning analysis of the provided assets and requirements.")
+    yield SimulatedMessage("agent_2", "Reviewing the initial analysis and providing feedback.")
+    yield SimulatedMessage(
+        "markdown_agent",
+        f"# {team_id.replace('_', ' ').title()} Output\n\nThis is the formatted final output from the {team_id} team conversation.\n\n## Summary\n\nThe team has successfully completed the workflow."
+    )
@@ -74,6 +74,46 @@ class TestObservableTeamSubscriptions(unittest.TestCase):
         self.assertTrue(started)
         self.assertEqual(team.started_with, [])
 
+    def test_concurrent_sets_start_team_once(self):
+        store = WorkflowOrchestrator(max_workers=4)
+        team = FakeTeam()
+        starts = []
+        team.start = lambda agent_ids: (starts.append(list(agent_ids)), team.start_event.set())
+
+        store.subscribe_team(team, ['a1'])
+        store.run()
+
+        # many threads report the dependency complete at once
+        threads = [threading.Thread(target=store.set, args=('a1', TaskStatus.COMPLETE)) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(team.start_event.wait(timeout=1.0))
+        time.sleep(0.05)
+        self.assertEqual(starts, [['a1']])
+
+    def test_failed_start_submission_marks_team_error(self):
+        store = WorkflowOrchestrator(max_workers=4)
+        team = FakeTeam()
+        team.id = 'team_b'
+
+        store.subscribe_team(team, ['a1'])
+        store.run()
+
+        # the executor can no longer accept work (e.g. during shutdown)
+        store._executor.shutdown()
+        store.set('a1', TaskStatus.COMPLETE)
+
+        self.assertFalse(team.start_event.is_set())
+        self.assertEqual(store.get('team_b'), TaskStatus.ERROR)
+        self.assertTrue(store.has_errors())
+
+        # the claimed subscription is dropped rather than retried forever
+        store.set('a2', TaskStatus.COMPLETE)
+        self.assertFalse(team.start_event.wait(timeout=0.1))
+
 
 if __name__ == '__main__':
     unittest.main()
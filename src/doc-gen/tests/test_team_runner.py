@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+"""
+Tests for TeamRunner helpers
+
+Test the pieces of the real team runner that do not need a model client.
+"""
+
+import asyncio
+import concurrent.futures
+import glob
+import unittest
+import tempfile
+import os
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# Add parent directory to path to import modules
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import team_runner
+from team_runner import TeamRunner, TeamRunnerFactory, _ConversationLog, _DirListing, _load_template
+
+
+class TestLoadTemplate(unittest.TestCase):
+    """Test cases for the cached template loader"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.template_path = Path(self.temp_dir.name) / "team.yaml"
+        self.template_path.write_text("agents:\n  - name: writer\n", encoding='utf-8')
+        _load_template.cache_clear()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.temp_dir.cleanup()
+
+    def load(self):
+        """Load the template keyed on its current stat, as the runner does"""
+        stat = self.template_path.stat()
+        return _load_template(str(self.template_path), stat.st_mtime_ns, stat.st_size)
+
+    def test_same_mtime_is_parsed_once(self):
+        """Test that repeated loads of an unchanged template hit the cache"""
+        first = self.load()
+        second = self.load()
+
+        self.assertIs(first, second)
+        self.assertEqual(_load_template.cache_info().misses, 1)
+        self.assertEqual(first['agents'][0]['name'], 'writer')
+
+    def test_changed_mtime_reparses(self):
+        """Test that editing the template invalidates the cached copy"""
+        mtime = self.template_path.stat().st_mtime
+        self.load()
+
+        self.template_path.write_text("agents:\n  - name: editor\n", encoding='utf-8')
+        os.utime(self.template_path, (mtime + 10, mtime + 10))
+        reloaded = self.load()
+
+        self.assertEqual(reloaded['agents'][0]['name'], 'editor')
+
+    def test_same_mtime_rewrite_reparses(self):
+        """Test that a rewrite within the same mtime tick is caught by the size"""
+        stat = self.template_path.stat()
+        self.load()
+
+        self.template_path.write_text("agents:\n  - name: reviewer\n", encoding='utf-8')
+        os.utime(self.template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        reloaded = self.load()
+
+        self.assertEqual(reloaded['agents'][0]['name'], 'reviewer')
+
+    def test_cached_template_is_read_only(self):
+        """Test that the shared template cannot be mutated by a caller"""
+        template = self.load()
+
+        with self.assertRaises(TypeError):
+            template['agents'] = []
+        with self.assertRaises(TypeError):
+            template['agents'][0]['name'] = 'editor'
+        self.assertEqual(template['agents'][0]['name'], 'writer')
+
+
+class TestExtractMessageContent(unittest.TestCase):
+    """Test cases for pulling content and source out of conversation messages"""
+
+    class SourcedMessage:
+        def __init__(self, source, content):
+            self.source = source
+            self.content = content
+
+    class TextEvent:
+        def __init__(self, text):
+            self.text = text
+
+    class OpaqueEvent:
+        pass
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.runner = TeamRunner()
+
+    def test_source_and_content(self):
+        """Test a regular agent message"""
+        message = self.SourcedMessage('writer', '  draft  ')
+        self.assertEqual(self.runner._extract_message_content(message), ('draft', 'writer'))
+
+    def test_list_content_uses_first_string(self):
+        """Test that multi-part content keeps its first text part"""
+        message = self.SourcedMessage('writer', ['first', 'second'])
+        self.assertEqual(self.runner._extract_message_content(message), ('first', 'writer'))
+
+    def test_text_without_source(self):
+        """Test text-only events fall back to the System source"""
+        self.assertEqual(self.runner._extract_message_content(self.TextEvent('hello')), ('hello', 'System'))
+
+    def test_unknown_event_placeholder(self):
+        """Test that unknown events are summarized instead of dumped"""
+        self.assertEqual(self.runner._extract_message_content(self.OpaqueEvent()), ('[OpaqueEvent event]', 'System'))
+
+    def test_repeated_types_are_extracted_consistently(self):
+        """Test that cached type dispatch gives the same result on later messages"""
+        for content in ('one', 'two'):
+            message = self.SourcedMessage('editor', content)
+            self.assertEqual(self.runner._extract_message_content(message), (content, 'editor'))
+
+
+class TestExtractAgentFlow(unittest.TestCase):
+    """Test cases for summarising conversation steps"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.runner = TeamRunner()
+
+    def test_multi_line_sections(self):
+        """Test that each section's non-blank lines are stripped and joined"""
+        steps = ("# team x - Conversation Steps\n\n"
+                 "<!--- SECTION: WRITER --->\n"
+                 "First line\n"
+                 "   second line   \n"
+                 "\n"
+                 "third\n"
+                 "<!--- END SECTION: WRITER --->\n\n"
+                 "<!--- SECTION: EDITOR --->\n"
+                 "Looks good\n"
+                 "<!--- END SECTION: EDITOR --->\n")
+        self.assertEqual(self.runner._extract_agent_flow(steps),
+                         "WRITER: First line second line third\nEDITOR: Looks good")
+
+    def test_unterminated_and_empty_sections(self):
+        """Test that a new section closes the previous one, empty sections are skipped and a trailing section is kept"""
+        steps = ("<!--- SECTION: EMPTY --->\n\n"
+                 "<!--- SECTION: A --->\nalpha\n"
+                 "<!--- SECTION: B --->\nbeta <!--- SECTION: NOT A MARKER --->\n")
+        self.assertEqual(self.runner._extract_agent_flow(steps),
+                         "A: alpha\nB: beta <!--- SECTION: NOT A MARKER --->")
+
+    def test_long_section_summary_is_truncated(self):
+        """Test that a section summary is cut to 200 characters"""
+        steps = "<!--- SECTION: WRITER --->\n" + "word " * 30 + "\n" + "more " * 30 + "\n"
+        summary = ("word " * 30).strip() + " " + ("more " * 30).strip()
+        self.assertEqual(self.runner._extract_agent_flow(steps), f"WRITER: {summary[:200]}...")
+
+    def test_fallback_without_sections(self):
+        """Test that content without sections is returned, truncated when long"""
+        self.assertEqual(self.runner._extract_agent_flow(""), "No conversation steps found")
+        self.assertEqual(self.runner._extract_agent_flow("plain notes"), "plain notes")
+        long_steps = "x" * 2000
+        self.assertEqual(self.runner._extract_agent_flow(long_steps),
+                         "x" * 1500 + "\n\n[Content truncated for context efficiency...]")
+
+
+class TestDirListing(unittest.TestCase):
+    """Test cases for the job folder snapshot"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.temp_dir.name)
+        for name in ("epic_a.md", "epic_b.md", "epic_b.steps.md", "notes.txt", ".epic_hidden.md"):
+            (self.folder / name).write_text(name, encoding='utf-8')
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.temp_dir.cleanup()
+
+    def test_matches_glob(self):
+        """Test that results equal glob.glob for the same pattern"""
+        for pattern in ("epic_*.md", "*.steps.md", "epic_?.md", "*", ".*", "[en]*", "missing_*"):
+            with self.subTest(pattern=pattern):
+                self.assertEqual(sorted(_DirListing(self.folder).glob(pattern)),
+                                 sorted(glob.glob(str(self.folder / pattern))))
+
+    def test_missing_directory(self):
+        """Test that a missing directory matches nothing"""
+        self.assertEqual(_DirListing(self.folder / "absent").glob("*.md"), [])
+
+    def test_stat_from_snapshot(self):
+        """Test that stat answers from the listing, including missing files"""
+        listing = _DirListing(self.folder)
+        self.assertEqual(listing.stat(self.folder / "epic_a.md").st_size, len("epic_a.md"))
+        with self.assertRaises(FileNotFoundError):
+            listing.stat(self.folder / "absent.md")
+
+
+class TestLoadFileContent(unittest.TestCase):
+    """Test cases for cached input file loading"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "epic_discovery.md"
+        self.runner = TeamRunner()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.temp_dir.cleanup()
+
+    def test_strips_terminate(self):
+        """Test that TERMINATE is removed and the content framed"""
+        self.path.write_text("Epics\nTERMINATE\n", encoding='utf-8')
+        self.assertEqual(self.runner._load_file_content(self.path, "epic_discovery.md"),
+                         "=== epic_discovery.md ===\nEpics\n")
+
+    def test_rewrite_within_same_mtime_is_reloaded(self):
+        """Test that a changed size invalidates the cache even if the mtime is unchanged"""
+        self.path.write_text("first", encoding='utf-8')
+        mtime_ns = self.path.stat().st_mtime_ns
+        self.assertIn("first", self.runner._load_file_content(self.path, "epic"))
+        self.path.write_text("second version", encoding='utf-8')
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+        self.assertIn("second version", self.runner._load_file_content(self.path, "epic"))
+        self.assertEqual(len(self.runner.content_cache), 1)
+
+    def test_missing_file(self):
+        """Test that a missing file loads as None"""
+        self.assertIsNone(self.runner._load_file_content(self.path, "epic_discovery.md"))
+
+    def test_task_message_follows_rewrite_within_same_mtime(self):
+        """Test that the task message picks up an input rewritten without an mtime change"""
+        config = SimpleNamespace(id="Content_Team", document_type="RAQ", job_folder=self.temp_dir.name,
+                                 labeled_inputs=[["Epics", "epic_discovery.md"], ["Arts", "epic_*.md"]])
+        runner = TeamRunner(config)
+        self.path.write_text("first", encoding='utf-8')
+        mtime_ns = self.path.stat().st_mtime_ns
+        self.assertIn("first", runner._prepare_task_message())
+        self.path.write_text("second version", encoding='utf-8')
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+        message = runner._prepare_task_message()
+        self.assertNotIn("first", message)
+        self.assertEqual(message.count("second version"), 2)
+
+
+class RecordingFile:
+    """Async file stand-in that records every call in a shared event list"""
+
+    def __init__(self, name, events, fail_writes=False):
+        self.name = name
+        self.events = events
+        self.fail_writes = fail_writes
+
+    async def write(self, data):
+        if self.fail_writes:
+            raise OSError(f"{self.name}: disk full")
+        self.events.append((self.name, "write", data))
+        return len(data)
+
+    async def flush(self):
+        self.events.append((self.name, "flush", None))
+
+    async def close(self):
+        self.events.append((self.name, "close", None))
+
+
+class RecordingLogger:
+    """Logger stand-in that keeps every message in order"""
+
+    def __init__(self):
+        self.lines = []
+
+    def log(self, message, component="core"):
+        self.lines.append(message)
+
+    def error(self, message, component="core"):
+        self.lines.append(f"ERROR {message}")
+
+
+class TestLabeledInputs(unittest.TestCase):
+    """Test cases for resolving labeled inputs"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        folder = Path(self.temp_dir.name)
+        for name, text in (("epic_discovery.md", "Epics"), ("brief.md", "Brief"),
+                           ("art_1.md", "A1"), ("art_2.md", "A2")):
+            (folder / name).write_text(text, encoding='utf-8')
+        self.logger = RecordingLogger()
+        config = SimpleNamespace(id="Content_Team", document_type="RAQ", job_folder=self.temp_dir.name,
+                                 labeled_inputs=[["Epics", "epic_discovery_artifacts"], ["Arts", "art_*.md"],
+                                                 ["Brief", "brief.md"], ["Missing", "missing.md"],
+                                                 ["Brief Again", "brief.md"]])
+        self.runner = TeamRunner(config, self.logger)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.temp_dir.cleanup()
+
+    def test_inputs_resolve_by_kind(self):
+        """Test that artifacts, globs and literal files resolve to their contents"""
+        inputs = self.runner._get_labeled_file_inputs()
+        self.assertEqual(inputs["Epics"], "=== epic_discovery.md ===\nEpics\n")
+        self.assertIn("=== art_1.md ===\nA1\n", inputs["arts"])
+        self.assertIn("=== art_2.md ===\nA2\n", inputs["arts"])
+        self.assertEqual(inputs["Brief Again"], inputs["Brief"])
+        self.assertIn("ERROR: File not found", inputs["Missing"])
+
+    def test_log_lines_follow_configuration_order(self):
+        """Test that resolver logs come out in label order, once per distinct input"""
+        self.runner._get_labeled_file_inputs()
+        resolver_lines = [line for line in self.logger.lines if not line.startswith("Loaded labeled input")]
+        self.assertEqual(resolver_lines, [
+            "Resolved epic_discovery_artifacts -> epic_discovery.md",
+            "Glob art_*.md matched 2 files",
+            "Loaded input file: brief.md",
+            f"ERROR Input file not found: {Path(self.temp_dir.name) / 'missing.md'}",
+        ])
+
+
+class TestConversationLog(unittest.TestCase):
+    """Test cases for the queued conversation log writer"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.events = []
+
+    def run_log(self, produce, batch_size=32, fail_steps=False):
+        """Create a log on fresh files, let produce() write to it, then close it"""
+        async def scenario():
+            log = _ConversationLog(RecordingFile("steps", self.events, fail_steps),
+                                   RecordingFile("raw", self.events),
+                                   RecordingFile("records", self.events), batch_size)
+            produce(log)
+            await log.aclose()
+        asyncio.run(scenario())
+
+    def file_events(self, name):
+        """Return the (op, data) calls made on one file"""
+        return [(op, data) for file_name, op, data in self.events if file_name == name]
+
+    def test_entries_are_batched_into_one_write_per_file(self):
+        """Test that queued entries are joined into a single write per file"""
+        def produce(log):
+            log.write_steps("<a>", "one", "</a>")
+            log.write_steps("<b>", "two", "</b>")
+            log.write_record("writer", "one")
+        self.run_log(produce)
+        self.assertEqual(self.file_events("steps"), [("write", "<a>one</a><b>two</b>"), ("close", None)])
+        self.assertEqual(self.file_events("records"),
+                         [("write", '{"source":"writer","content":"one"}\n'), ("close", None)])
+
+    def test_batch_size_bounds_each_write(self):
+        """Test that a batch never takes more than batch_size entries"""
+        self.run_log(lambda log: [log.write_steps(part) for part in "abc"], batch_size=2)
+        self.assertEqual(self.file_events("steps"), [("write", "ab"), ("write", "c"), ("close", None)])
+
+    def test_flush_checkpoint_orders_writes(self):
+        """Test that a checkpoint writes and flushes earlier entries before later ones"""
+        def produce(log):
+            log.write_steps("before")
+            log.flush()
+            log.write_steps("after")
+        self.run_log(produce)
+        self.assertEqual(self.file_events("steps"),
+                         [("write", "before"), ("flush", None), ("write", "after"), ("close", None)])
+        self.assertEqual(self.file_events("raw"), [("flush", None), ("close", None)])
+
+    def test_aclose_writes_everything_before_closing(self):
+        """Test that aclose drains the queue before any file is closed"""
+        self.run_log(lambda log: [log.write_raw(str(i)) for i in range(100)], batch_size=8)
+        ops = [op for _, op, _ in self.events]
+        self.assertEqual(ops.index("close"), len(ops) - 3)
+        self.assertEqual("".join(data for op, data in self.file_events("raw") if op == "write"),
+                         "".join(str(i) for i in range(100)))
+
+    def test_write_error_is_raised_from_aclose(self):
+        """Test that a failed write surfaces from aclose after the other files are written and closed"""
+        def produce(log):
+            log.write_steps("lost")
+            log.write_record("writer", "kept")
+        with self.assertRaises(OSError):
+            self.run_log(produce, batch_size=1, fail_steps=True)
+        self.assertIn(("write", '{"source":"writer","content":"kept"}\n'), self.file_events("records"))
+        self.assertEqual([name for name, op, _ in self.events if op == "close"], ["raw", "steps", "records"])
+
+
+class TestDevModeFallback(unittest.TestCase):
+    """Test cases for the RAQ_DEV simulation fallback"""
+
+    class FailingTeam:
+        def run_stream(self, task):
+            raise RuntimeError("model unavailable")
+
+    def run_conversation(self):
+        """Run one conversation on a team whose stream fails, returning (result, events)"""
+        events = []
+        runner = TeamRunner()
+        runner.autogen_team = self.FailingTeam()
+
+        async def scenario():
+            log = _ConversationLog(RecordingFile("steps", events), RecordingFile("raw", events),
+                                   RecordingFile("records", events))
+            try:
+                return await runner._execute_conversation("task", log, "team_x")
+            finally:
+                await log.aclose()
+        return asyncio.run(scenario()), events
+
+    def test_failed_stream_is_simulated_once(self):
+        """Test that dev mode writes exactly one simulated conversation"""
+        with mock.patch.object(team_runner, "_DEV_MODE", True):
+            result, events = self.run_conversation()
+        steps = "".join(data for name, op, data in events if name == "steps" and op == "write")
+        self.assertEqual(steps.count("<!--- SECTION: MARKDOWN AGENT --->"), 1)
+        self.assertEqual(steps.count("<!--- SECTION:"), 4)
+        self.assertTrue(result.startswith("# Team X Output"))
+
+    def test_failed_stream_raises_outside_dev_mode(self):
+        """Test that production runs surface the failure instead of simulating"""
+        with mock.patch.object(team_runner, "_DEV_MODE", False):
+            with self.assertRaises(RuntimeError):
+                self.run_conversation()
+
+
+def rate_limit_error():
+    """Build the openai error the model client raises on HTTP 429"""
+    import httpx
+    from openai import RateLimitError
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return RateLimitError("rate limited", response=httpx.Response(429, request=request), body=None)
+
+
+class ScriptedTeam:
+    """AutoGen team stand-in whose streams raise or yield per a script"""
+
+    def __init__(self, script):
+        self.script = list(script)  # one entry per run_stream call: list of messages or exceptions
+        self.streams = 0
+        self.resets = 0
+
+    async def run_stream(self, task):
+        self.streams += 1
+        for item in self.script.pop(0):
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    async def reset(self):
+        self.resets += 1
+
+
+class TestRateLimitRetry(unittest.TestCase):
+    """Test cases for the rate-limit retry and the shared model slots"""
+
+    FINAL = SimpleNamespace(source="markdown_agent", content="# Done")
+
+    def run_conversation(self, runner):
+        """Run one conversation on the runner's team with sleeps skipped, returning (result, sleep mock)"""
+        async def scenario():
+            events = []
+            log = _ConversationLog(RecordingFile("steps", events), RecordingFile("raw", events),
+                                   RecordingFile("records", events))
+            try:
+                return await runner._run_async_conversation("task", log, "team_x")
+            finally:
+                await log.aclose()
+        with mock.patch.object(team_runner.asyncio, "sleep", mock.AsyncMock()) as sleep:
+            return asyncio.run(scenario()), sleep
+
+    def make_runner(self, script, semaphore=None):
+        runner = TeamRunner(llm_semaphore=semaphore)
+        runner.autogen_team = ScriptedTeam(script)
+        return runner
+
+    def test_retries_until_stream_succeeds(self):
+        """Test that a rate limit before the first message resets the team and retries"""
+        runner = self.make_runner([[rate_limit_error()], [rate_limit_error()], [self.FINAL]])
+        result, sleep = self.run_conversation(runner)
+        self.assertEqual(result, "# Done")
+        self.assertEqual(runner.autogen_team.streams, 3)
+        self.assertEqual(runner.autogen_team.resets, 2)
+        self.assertEqual(sleep.await_count, 2)
+
+    def test_gives_up_after_retry_limit(self):
+        """Test that the error surfaces once the retries are used up"""
+        from openai import RateLimitError
+        retries = team_runner._RATE_LIMIT_RETRIES
+        runner = self.make_runner([[rate_limit_error()]] * (retries + 1))
+        with self.assertRaises(RateLimitError):
+            self.run_conversation(runner)
+        self.assertEqual(runner.autogen_team.streams, retries + 1)
+        self.assertEqual(runner.autogen_team.resets, retries)
+
+    def test_no_retry_after_first_message(self):
+        """Test that a rate limit mid-conversation keeps the messages instead of replaying them"""
+        first = SimpleNamespace(source="agent_1", content="Working on it.")
+        runner = self.make_runner([[first, rate_limit_error()], [self.FINAL]])
+        result, sleep = self.run_conversation(runner)
+        self.assertIsNone(result)
+        self.assertEqual(runner.autogen_team.streams, 1)
+        self.assertEqual(runner.autogen_team.resets, 0)
+        sleep.assert_not_awaited()
+
+    def test_slot_released_on_error(self):
+        """Test that a failing stream gives its model slot back"""
+        async def scenario():
+            semaphore = asyncio.Semaphore(1)
+            runner = self.make_runner([[RuntimeError("boom")]], semaphore)
+            events = []
+            log = _ConversationLog(RecordingFile("steps", events), RecordingFile("raw", events),
+                                   RecordingFile("records", events))
+            try:
+                with self.assertRaises(RuntimeError):
+                    await runner._run_async_conversation("task", log, "team_x")
+            finally:
+                await log.aclose()
+            return semaphore.locked()
+        self.assertFalse(asyncio.run(scenario()))
+
+    def test_shared_slot_serializes_runners(self):
+        """Test that two runners sharing one slot never stream at the same time"""
+        active = []
+        peak = []
+
+        class TrackingTeam:
+            async def run_stream(self, task):
+                active.append(task)
+                peak.append(len(active))
+                for _ in range(3):
+                    await asyncio.sleep(0)
+                    yield TestRateLimitRetry.FINAL
+                active.remove(task)
+
+        async def scenario():
+            semaphore = asyncio.Semaphore(1)
+            runners = [TeamRunner(llm_semaphore=semaphore) for _ in range(2)]
+            events = []
+            log = _ConversationLog(RecordingFile("steps", events), RecordingFile("raw", events),
+                                   RecordingFile("records", events))
+            for runner in runners:
+                runner.autogen_team = TrackingTeam()
+            try:
+                return await asyncio.gather(*(runner._run_async_conversation(f"task {i}", log, f"team_{i}")
+                                              for i, runner in enumerate(runners)))
+            finally:
+                await log.aclose()
+
+        self.assertEqual(asyncio.run(scenario()), ["# Done", "# Done"])
+        self.assertEqual(peak, [1, 1])
+
+
+class TestTeamRunnerFactoryShutdown(unittest.TestCase):
+    """Test cases for releasing the factory's shared loop"""
+
+    def test_loop_stops_when_client_close_fails(self):
+        """Test that the loop and its thread are released even if closing a client raises"""
+        class FailingClient:
+            async def close(self):
+                raise RuntimeError("close failed")
+
+        factory = TeamRunnerFactory()
+        loop = factory.get_event_loop()
+        thread = factory._loop_thread
+        factory._clients[("gpt-4o-mini", 0.3)] = FailingClient()
+
+        with self.assertRaises(RuntimeError):
+            factory.shutdown()
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(loop.is_closed())
+
+    def test_shutdown_cancels_run_in_flight(self):
+        """Test that a caller waiting on an unfinished run is released by shutdown"""
+        factory = TeamRunnerFactory()
+        loop = factory.get_event_loop()
+
+        async def never_finishes():
+            await asyncio.Event().wait()
+
+        # an orchestrator thread blocked on its runner, as Team.start does
+        run = asyncio.run_coroutine_threadsafe(never_finishes(), loop)
+        outcome = []
+        waiter = threading.Thread(target=lambda: outcome.append(self._wait(run)), daemon=True)
+        waiter.start()
+
+        factory.shutdown()
+        waiter.join(timeout=1.0)
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(outcome, ["cancelled"])
+        self.assertTrue(loop.is_closed())
+
+    @staticmethod
+    def _wait(future):
+        try:
+            future.result()
+        except concurrent.futures.CancelledError:
+            return "cancelled"
+        return "finished"
+
+
+if __name__ == '__main__':
+    unittest.main()
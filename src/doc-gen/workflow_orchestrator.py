@@ -115,23 +115,10 @@ class WorkflowOrchestrator:
             
             self._orchestration_enabled = True
             self._logger.log("Orchestration enabled - triggering first orchestration cycle")
-            
-            # Create copies for evaluation outside the lock
-            data_copy = self._data.copy()
-            team_subs_copy = [dict(s) for s in self._team_subs]
+            ready = self._claim_ready_teams()
 
         # Trigger initial orchestration cycle
-        for sub in team_subs_copy:
-            try:
-                if not sub.get('triggered') and self._should_trigger_team(sub, data_copy):
-                    self._executor.submit(self._safe_team_action, sub, 'start', list(sub['agent_ids']), data_copy)
-                    with self._lock:
-                        for real_sub in self._team_subs:
-                            if real_sub is sub or (real_sub['team'] == sub['team'] and real_sub['agent_ids'] == sub['agent_ids']):
-                                real_sub['triggered'] = True
-                                break
-            except Exception as e:
-                self._logger.error(f"initial orchestration evaluation error: {e}")
+        self._start_teams(ready)
     
     def set(self, key: str, value: TaskStatus):
         """Set a key-value pair and notify subscribers asynchronously.
@@ -144,22 +131,43 @@ class WorkflowOrchestrator:
             # Skip orchestration if not enabled yet
             if not self._orchestration_enabled:
                 return
-            # Create copies for evaluation outside the lock
-            data_copy = self._data.copy()
-            team_subs_copy = [dict(s) for s in self._team_subs]
+            ready = self._claim_ready_teams()
+
+        self._start_teams(ready)
+
+    def _claim_ready_teams(self) -> List[Dict[str, Any]]:
+        """Mark and return the subscriptions whose teams should start now.
 
-        # Evaluate team subscriptions quickly and submit long-running actions
-        for sub in team_subs_copy:
+        Called with the lock held. Claiming under the lock means concurrent
+        set() calls cannot start the same team twice, and no statuses or
+        subscriptions need copying.
+        """
+        ready = []
+        for sub in self._team_subs:
+            if sub['triggered']:
+                continue
             try:
-                if not sub.get('triggered') and self._should_trigger_team(sub, data_copy):
-                    self._executor.submit(self._safe_team_action, sub, 'start', list(sub['agent_ids']), data_copy)
-                    with self._lock:
-                        for real_sub in self._team_subs:
-                            if real_sub is sub or (real_sub['team'] == sub['team'] and real_sub['agent_ids'] == sub['agent_ids']):
-                                real_sub['triggered'] = True
-                                break
+                if self._should_trigger_team(sub, self._data):
+                    sub['triggered'] = True
+                    ready.append(sub)
             except Exception as e:
                 self._logger.error(f"subscription evaluation error: {e}")
+        return ready
+
+    def _start_teams(self, ready: List[Dict[str, Any]]):
+        """Submit start actions for claimed subscriptions to the executor."""
+        for sub in ready:
+            try:
+                self._executor.submit(self._safe_team_action, sub, 'start', list(sub['agent_ids']))
+            except Exception as e:
+                team = sub['team']
+                self._logger.error(f"team start submission error for team {getattr(team, 'id', str(team))}: {e}")
+                # The team was claimed but will never start: fail it instead of leaving the workflow waiting
+                with self._lock:
+                    if sub in self._team_subs:
+                        self._team_subs.remove(sub)
+                    if hasattr(team, 'id'):
+                        self._data[team.id] = TaskStatus.ERROR
 
     def _dependencies_complete(self, sub: Dict[str, Any], data: TaskStatusDict) -> bool:
         """Return True when all dependency agent ids are COMPLETE (or none given)."""
@@ -184,7 +192,7 @@ class WorkflowOrchestrator:
         # Check if dependencies are complete
         return self._dependencies_complete(sub, data)
 
-    def _safe_team_action(self, sub: Dict[str, Any], action: str, arg: Any, data: TaskStatusDict):
+    def _safe_team_action(self, sub: Dict[str, Any], action: str, arg: Any):
         """Execute a team action (start/stop) safely in the executor."""
         team = sub.get('team')
         try: